@@ -6,6 +6,7 @@
 #include <sstream>
 #include <string>
 #include <unordered_map>
+#include <unordered_set>
 #include <vector>
 
 using namespace std;
@@ -51,6 +52,8 @@ vector<unsigned int> p2p_info_pointer;
 // vector<int> trace_log[MAX_NPROCS];
 vector<vector<int>> trace_log;
 vector<CDE*> comm_dep_edge;
+// index of recorded edges, avoids scanning comm_dep_edge for each match
+unordered_set<string> comm_dep_edge_keys;
 
 void readMPIInfo(string file_name, int pid) {
   coll_info_pointer[pid] = 0;
@@ -161,14 +164,14 @@ void readTraceInfo(string file_name, int pid) {
   inputStream.close();
 }
 
+string CDEKey(int dest_type, int src_type, const string& dest_callpath, const string& src_callpath, int dest_pid,
+              int src_pid) {
+  return to_string(dest_type) + "|" + to_string(src_type) + "|" + dest_callpath + "|" + src_callpath + "|" +
+         to_string(dest_pid) + "|" + to_string(src_pid);
+}
+
 bool existCDE(int dest_type, int src_type, string dest_callpath, string src_callpath, int dest_pid, int src_pid) {
-  for (auto cde : comm_dep_edge) {
-    if (cde->dest_type == dest_type && cde->src_type == src_type && !cde->dest_callpath.compare(dest_callpath) &&
-        !cde->src_callpath.compare(src_callpath) && cde->dest_pid == dest_pid && cde->src_pid == src_pid) {
-      return true;
-    }
-  }
-  return false;
+  return comm_dep_edge_keys.count(CDEKey(dest_type, src_type, dest_callpath, src_callpath, dest_pid, src_pid)) > 0;
 }
 
 // output inter-process communication dependence edge : (dest , src , edge value) -> (type | call path | pid , type |
@@ -228,6 +231,7 @@ void commOpMatch(int pid) {
                 one_comm_dep_edge->src_pid = src_pid;
                 one_comm_dep_edge->exe_time = exe_time;
                 comm_dep_edge.push_back(one_comm_dep_edge);
+                comm_dep_edge_keys.insert(CDEKey(dest_type, src_type, dest_callpath, src_callpath, dest_pid, src_pid));
 
 #ifdef DEBUG
                 cout << dest_type << " | " << dest_callpath << " | " << dest_pid << ", ";
@@ -289,6 +293,7 @@ void commOpMatchWithMPIInfo(int pid) {
             one_comm_dep_edge->src_pid = src_pid;
             one_comm_dep_edge->exe_time = exe_time;
             comm_dep_edge.push_back(one_comm_dep_edge);
+            comm_dep_edge_keys.insert(CDEKey(dest_type, src_type, dest_callpath, src_callpath, dest_pid, src_pid));
 
             break;
           }
@@ -255,8 +255,9 @@ int pthread_join(pthread_t thread, void **value_ptr) {
   baguatool::type::addr_t out_call_path[MAX_CALL_PATH_DEPTH] = {0};
   int out_call_path_len = sampler->GetBacktrace(out_call_path, MAX_CALL_PATH_DEPTH);
   int create_thread_id = 0;
-  if (pthread_t_to_create_thread_id.find(thread) != pthread_t_to_create_thread_id.end()) {
-    create_thread_id = pthread_t_to_create_thread_id[thread];
+  auto create_thread_it = pthread_t_to_create_thread_id.find(thread);
+  if (create_thread_it != pthread_t_to_create_thread_id.end()) {
+    create_thread_id = create_thread_it->second;
   }
   /** recording */
   perf_data->RecordEdgeData((baguatool::type::addr_t *)nullptr, 0, out_call_path, out_call_path_len, 0, 0,
@@ -319,8 +320,9 @@ int pthread_mutex_lock(pthread_mutex_t *mutex) {
       dbg(time);
 
       std::pair<u_int64_t, call_path_t *> tid_cp_pair;
-      if (mutex_to_tid_and_callpath->find((u_int64_t)mutex) != mutex_to_tid_and_callpath->end()) {
-        tid_cp_pair = (*mutex_to_tid_and_callpath)[(u_int64_t)mutex];
+      auto tid_cp_it = mutex_to_tid_and_callpath->find((u_int64_t)mutex);
+      if (tid_cp_it != mutex_to_tid_and_callpath->end()) {
+        tid_cp_pair = tid_cp_it->second;
       }
 
       baguatool::type::addr_t call_path[MAX_CALL_PATH_DEPTH] = {0};
@@ -337,8 +339,9 @@ int pthread_mutex_lock(pthread_mutex_t *mutex) {
 
       int src_thread_id = 0;
 
-      if (tid_to_thread_gid->find(src_tid) != tid_to_thread_gid->end()) {
-        src_thread_id = (*tid_to_thread_gid)[src_tid];
+      auto src_thread_it = tid_to_thread_gid->find(src_tid);
+      if (src_thread_it != tid_to_thread_gid->end()) {
+        src_thread_id = src_thread_it->second;
       }
 
       perf_data->RecordEdgeData(cp->call_path, cp->call_path_len, call_path, call_path_len, 0, 0, src_thread_id,
@@ -2,6 +2,7 @@ import sys
 import os                                                                                                                                                     
 proj_dir = os.environ['BAGUA_DIR']                                                                                                                            
 sys.path.append(proj_dir + r"/python")       
+from collections import deque
 import perflow as pf                                                                                                          
 from pag import *   
 from graphvizoutput import *                                                                                                                                           
@@ -26,39 +27,28 @@ def critical_path():
   vertex_max_end_value = dict()
   vectex_start_critical_path = dict()
   vectex_end_critical_path = dict()
-  vertex_queue = list()
+  vertex_queue = deque()
 
-  for i in range(len(ppag.vs())):
-    vertex_self_value[i] = float(ppag.vs()[i]["CYCAVGPERCENT"])
+  for i, percent in enumerate(ppag.vs["CYCAVGPERCENT"]):
+    vertex_self_value[i] = float(percent)
   vertex_queue.append(num_vextices-1)
   vertex_max_end_value[num_vextices-1] = 0
   vectex_end_critical_path[num_vextices-1] = []
 
   # max_flow_search implemented with backward bfs
   while len(vertex_queue):
-    vid = vertex_queue[0]
-    del(vertex_queue[0])
+    vid = vertex_queue.popleft()
     #print(vertex_max_start_value[vid], vertex_max_end_value[vid])
     vertex_max_start_value[vid] = vertex_self_value[vid] + vertex_max_end_value[vid]
-    vectex_start_critical_path[vid] = []
-    vectex_start_critical_path[vid] += vectex_end_critical_path[vid]
-    vectex_start_critical_path[vid].append(vid)
+    vectex_start_critical_path[vid] = vectex_end_critical_path[vid] + [vid]
     parents = ppag.predecessors(vid)
+    start_value = vertex_max_start_value[vid]
+    start_path = vectex_start_critical_path[vid]
     for p in parents:
       vertex_queue.append(p)
-      max_value = 0
-      max_path = []
-      if vertex_max_end_value.__contains__(p):
-        max_value = vertex_max_end_value[p]
-        max_path = vectex_end_critical_path[p]
-        if vertex_max_start_value[vid] > max_value:
-          max_value = vertex_max_start_value[vid]
-          max_path = vectex_start_critical_path[vid]
-      else:
-        max_value = vertex_max_start_value[vid]
-        max_path = vectex_start_critical_path[vid]
-      vertex_max_end_value[p] = max_value
-      vectex_end_critical_path[p] = max_path
+      if p not in vertex_max_end_value or start_value > vertex_max_end_value[p]:
+        vertex_max_end_value[p] = start_value
+        vectex_end_critical_path[p] = start_path
 
   # return edge set
   edge_set = []
@@ -6,6 +6,8 @@ class ColorException(Exception):
 
 
 class Color(object):
+    # one Color is built per drawn vertex and edge, keep instances small
+    __slots__ = ('r', 'g', 'b', 'a')
 
     def __init__(self, r, g, b, a=1):
         self.r = r
@@ -56,11 +58,11 @@ class Color(object):
 
     def rgb_web(self):
         '''Returns a string with the RGB components as a HTML hex string.'''
-        return '#{0.r255:02x}{0.g255:02x}{0.b255:02x}'.format(self)
+        return '#%02x%02x%02x' % (self.r255, self.g255, self.b255)
 
     def rgba_web(self):
         '''Returns a string with the RGBA components as a HTML hex string.'''
-        return '{0}{1.a255:02x}'.format(self.rgb_web(), self)
+        return '#%02x%02x%02x%02x' % (self.r255, self.g255, self.b255, self.a255)
 
     def rgb_csv(self):
         '''Returns a string with the RGB components as CSV.'''
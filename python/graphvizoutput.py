@@ -27,7 +27,7 @@ class GraphvizOutput(Output):
         self.group_border_color = Color(0, 0, 0, 0.8)
         self.edges = []
         self.vertices = []
-        self.preserve_vertices = []
+        self.preserve_vertices = set()
         self.groups = []
 
         Output.__init__(self, **kwargs)
@@ -176,10 +176,7 @@ class GraphvizOutput(Output):
         ))
 
     def attrs_from_dict(self, d):
-        output = []
-        for attr, val in d.items():
-            output.append('%s = "%s"' % (attr, val))
-        return ', '.join(output)
+        return ', '.join(['%s = "%s"' % (attr, val) for attr, val in d.items()])
 
     def vertex(self, key, attr):
         return '"{0}" [{1}];'.format(
@@ -223,9 +220,10 @@ class GraphvizOutput(Output):
         output = []
         for i in range(len(vertices)):
             vertex = vertices[i]
+            attributes = vertex.attributes()
 
-            if preserve_attrs == "" or (preserve_attrs != "" and vertex.attributes().__contains__(preserve_attrs) and vertex[preserve_attrs]):
-                if vertex_color_depth_attr != "" and vertex.attributes().__contains__(vertex_color_depth_attr):
+            if preserve_attrs == "" or (preserve_attrs != "" and preserve_attrs in attributes and vertex[preserve_attrs]):
+                if vertex_color_depth_attr != "" and vertex_color_depth_attr in attributes:
                     attr = {
                         'color': self.node_color_func(vertex, float(vertex[vertex_color_depth_attr])).rgba_web(),
                         'label': self.node_label_func(vertex, vertex_attrs),
@@ -235,7 +233,7 @@ class GraphvizOutput(Output):
                         'color': self.node_color_func(vertex, 0.1).rgba_web(),
                         'label': self.node_label_func(vertex, vertex_attrs),
                     }
-                self.preserve_vertices.append(vertex["id"])
+                self.preserve_vertices.add(vertex["id"])
                 output.append(self.vertex(i, attr))
 
         return output
@@ -6,6 +6,8 @@ from distutils.spawn import find_executable
 from exceptions import PyCallGraphException
 from color import Color
 
+regex_user_expand = re.compile(r'\A~')
+
 
 class Output(object):
     '''Base class for all outputters.'''
@@ -72,22 +74,24 @@ class Output(object):
     def node_label(self, vertex, vertex_attrs):
         parts = []
 
-        for attr in vertex_attrs:
-            if attr in vertex.attributes().keys():
-                parts += [
-                    '{}: {}'.format(attr, vertex[attr])
-                ]
+        if vertex_attrs:
+            # list the attribute names once, not once per requested attribute
+            keys = vertex.attributes().keys()
+            for attr in vertex_attrs:
+                if attr in keys:
+                    parts.append('{}: {}'.format(attr, vertex[attr]))
 
         return r'\n'.join(parts)
 
     def edge_label(self, edge, edge_attrs):
         parts = []
 
-        for attr in edge_attrs:
-            if attr in edge.attributes().keys():
-                parts += [
-                    '{}: {}'.format(attr, edge[attr])
-                ]
+        # draw_edge passes plain [src, dst] pairs with no attributes requested
+        if edge_attrs:
+            keys = edge.attributes().keys()
+            for attr in edge_attrs:
+                if attr in keys:
+                    parts.append('{}: {}'.format(attr, edge[attr]))
 
         return r'\n'.join(parts)
         # return '{0}'.format(label)
@@ -137,7 +141,6 @@ class Output(object):
             'The command "{0}" is required to be in your path.'.format(cmd))
 
     def normalize_path(self, path):
-        regex_user_expand = re.compile('\A~')
         if regex_user_expand.match(path):
             path = os.path.expanduser(path)
         else:
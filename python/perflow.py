@@ -126,19 +126,19 @@ class PerFlow(object):
             metric = 'time'
         if n == 0:
             n = 10
-        return V.select(lambda v: float(v['CYCAVGPERCENT']) > 0.0001)
+        # fetch the whole attribute column at once rather than visiting vertices one by one
+        percents = V['CYCAVGPERCENT']
+        return V.select([i for i, p in enumerate(percents) if float(p) > 0.0001])
         #return V.sort_by(metric).top(n)
     
     def report(self, V, attrs=[]):
         if len(attrs) == 0:
             attrs = ['name', 'type', 'time', 'debug']
-        for attr in attrs:
-            print(attr, end='\t')
-        print()
+        # assemble the whole table and write it out in one go
+        lines = [''.join('{}\t'.format(attr) for attr in attrs)]
         for v in V:
-            for attr in attrs:
-                print(v[attr], end='\t')
-            print()
+            lines.append(''.join('{}\t'.format(v[attr]) for attr in attrs))
+        print('\n'.join(lines))
 
     def draw(self, g, save_pdf = '', mark_edges = []):
         if save_pdf == '':
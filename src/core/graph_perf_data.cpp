@@ -47,15 +47,16 @@ type::perf_data_t GraphPerfData::GetPerfData(type::vertex_t vertex_id, std::stri
   std::string process_id_str = std::to_string(procs_id);
   std::string thread_id_str = std::to_string(thread_id);
 
-  if (this->j_perf_data.contains(vertex_id_str)) {
-    if (this->j_perf_data[vertex_id_str].contains(metric_str)) {
-      if (this->j_perf_data[vertex_id_str][metric_str].contains(process_id_str)) {
-        if (this->j_perf_data[vertex_id_str][metric_str][process_id_str].contains(thread_id_str)) {
-          auto ret = this->j_perf_data[vertex_id_str][metric_str][process_id_str][thread_id_str];
-          if (ret != nullptr) {
-            data +=
-                this->j_perf_data[vertex_id_str][metric_str][process_id_str][thread_id_str].get<type::perf_data_t>();
-          }
+  // Walk down the json tree once, each level is looked up a single time
+  auto vertex_it = this->j_perf_data.find(vertex_id_str);
+  if (vertex_it != this->j_perf_data.end()) {
+    auto metric_it = vertex_it->find(metric_str);
+    if (metric_it != vertex_it->end()) {
+      auto procs_it = metric_it->find(process_id_str);
+      if (procs_it != metric_it->end()) {
+        auto thread_it = procs_it->find(thread_id_str);
+        if (thread_it != procs_it->end() && *thread_it != nullptr) {
+          data += thread_it->get<type::perf_data_t>();
         }
       }
     }